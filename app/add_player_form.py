@@ -1,5 +1,8 @@
 # add_player_form.py
+import hashlib
+import json
 import re
+import shutil
 import unicodedata
 import uuid
 from datetime import date
@@ -9,27 +12,35 @@ import streamlit as st
 
 from postgrest.exceptions import APIError
 
-from app.app_paths import DATA_DIR
+from app.app_paths import PLAYER_PHOTOS_DIR
 from app.supabase_client import get_client
 
 # ---------------------------
 # Helpers
 # ---------------------------
-def _fetch_team_players(team: str) -> list[dict]:
+@st.cache_data(show_spinner=False, ttl=30)
+def _cached_team_players(team: str) -> list[dict]:
     client = get_client()
-    if not client or not team:
+    if not client:
+        return []
+    # Vain duplikaatti- ja numerotarkistuksen tarvitsemat sarakkeet
+    res = (
+        client.table("players")
+        .select("name,date_of_birth,club_number")
+        .eq("team_name", team)
+        .execute()
+    )
+    return [dict(row) for row in (res.data or [])]
+
+
+def _fetch_team_players(team: str) -> list[dict]:
+    if not team:
         return []
     try:
-        res = (
-            client.table("players")
-            .select("id,name,date_of_birth,team_name,club_number")
-            .eq("team_name", team)
-            .execute()
-        )
+        return _cached_team_players(team)
     except APIError as err:  # pragma: no cover - UI error handling
         st.error(f"Failed to load players from Supabase: {getattr(err, 'message', str(err))}")
         return []
-    return [dict(row) for row in (res.data or [])]
 
 
 def _resolve_team(team: str) -> dict | None:
@@ -50,23 +61,101 @@ def _resolve_team(team: str) -> dict | None:
     rows = res.data or []
     return dict(rows[0]) if rows else None
 
+
+# PostgREST: funktiota ei löydy (migraatio 013 ajamatta)
+_RPC_NOT_FOUND = "PGRST202"
+# Postgres unique_violation
+_UNIQUE_VIOLATION = "23505"
+# Lomakkeen tallentamaton pelaaja-id (idempotentti tallennus)
+_PENDING_ID_KEY = "_add_player_pending_id"
+
+
+def _insert_player_legacy(client, team: str, record: dict) -> None:
+    """Pre-013 path: resolve or create the team, then insert the player."""
+    team_row = _resolve_team(team)
+    team_id = team_row.get("id") if team_row else None
+    if team_id is None:
+        try:
+            inserted = client.table("teams").insert({"name": team}).execute()
+            team_data = inserted.data or []
+            if team_data:
+                team_id = team_data[0].get("id")
+        except APIError:
+            # If insert fails (likely due to unique constraint), try loading again
+            team_row = _resolve_team(team)
+            team_id = team_row.get("id") if team_row else None
+    try:
+        client.table("players").insert(
+            {**record, "team_name": team, "team_id": team_id}
+        ).execute()
+    except APIError as err:
+        # Sama id on jo tallennettu (toistettu submit) → ei virhe
+        if getattr(err, "code", None) != _UNIQUE_VIOLATION:
+            raise
+
+
+def _pending_player_id(team: str, record: dict, photo) -> str:
+    """Reuse the pending id only while the submitted payload is unchanged."""
+    payload = team + "|" + json.dumps(record, sort_keys=True, default=str)
+    if photo is not None:
+        payload += f"|{photo.name}|{getattr(photo, 'size', '')}"
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    pending = st.session_state.get(_PENDING_ID_KEY)
+    if pending and pending[1] == digest:
+        return pending[0]
+    rec_id = uuid.uuid4().hex
+    st.session_state[_PENDING_ID_KEY] = (rec_id, digest)
+    return rec_id
+
+
+def _save_player(client, team: str, record: dict) -> None:
+    try:
+        # Joukkueen haku/luonti ja pelaajan lisäys yhdellä RPC-kutsulla
+        client.rpc(
+            "add_player_with_team", {"p_team": team, "p_record": record}
+        ).execute()
+    except APIError as err:
+        if getattr(err, "code", None) != _RPC_NOT_FOUND:
+            raise
+        _insert_player_legacy(client, team, record)
+
+
 def _norm_name(s: str) -> str:
-    s = (s or "").strip()
-    parts = [p.capitalize() if len(p) > 1 else p.upper() for p in s.split()]
-    return " ".join(parts)
+    parts = (s or "").split()
+    joined = " ".join(parts)
+    # Tavallinen ASCII-nimi (vain kirjaimia, ei nimikirjaimia): str.title() tekee saman C:ssä.
+    # Ei-ASCII jätetään pois: title() aloittaa uuden sanan caseless-kirjaimen (esim. U+02BC) jälkeen.
+    if (
+        joined.isascii()
+        and all(len(p) > 1 for p in parts)
+        and joined.replace(" ", "").isalpha()
+    ):
+        return joined.title()
+    return " ".join(p.capitalize() if len(p) > 1 else p.upper() for p in parts)
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+# Yleisimmät suomen/espanjan diakriitit; muut menevät NFKD-polun kautta
+_DIACRITIC_TABLE = str.maketrans(
+    "åäöáéíóúñüÅÄÖÁÉÍÓÚÑÜ",
+    "aaoaeiounuAAOAEIOUNU",
+)
 
 def _slugify(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    s = s.encode("ascii", "ignore").decode("ascii")
-    s = re.sub(r"[^A-Za-z0-9]+", "-", s).strip("-").lower()
+    s = s.translate(_DIACRITIC_TABLE)
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        s = s.encode("ascii", "ignore").decode("ascii")
+    s = _SLUG_RE.sub("-", s).strip("-").lower()
     return s or "player"
 
 def _age_from_dob(d: date) -> int:
     today = date.today()
-    return today.year - d.year - ((today.month, today.day) < (d.month, d.day))
+    return today.year - d.year - (today.month * 100 + today.day < d.month * 100 + d.day)
+
+_FOOT_MAP = {"Oikea": "Right", "Vasen": "Left", "Molemmat": "Both", "": ""}
 
 def _foot_label_to_value(lbl: str) -> str:
-    return {"Oikea": "Right", "Vasen": "Left", "Molemmat": "Both", "": ""}.get(lbl, lbl)
+    return _FOOT_MAP.get(lbl, lbl)
 
 def _push_to_master(team: str, record: dict) -> None:  # legacy helper retained
     """Clear cached data so new Supabase rows appear instantly in editors."""
@@ -78,6 +167,10 @@ def _push_to_master(team: str, record: dict) -> None:  # legacy helper retained
 POSITIONS_PRIMARY = [
     "GK","RB","RWB","CB","LB","LWB","DM","CM","AM","RW","LW","ST"
 ]
+_DEFAULT_PRIMARY_IDX = POSITIONS_PRIMARY.index("CM")
+_SECONDARY_CHOICES = {
+    p: [q for q in POSITIONS_PRIMARY if q != p] for p in POSITIONS_PRIMARY
+}
 
 # ---------------------------
 # UI
@@ -91,11 +184,19 @@ def show_add_player_form():
         return
 
     existing_team = _fetch_team_players(team)
-    existing_numbers = sorted({
-        int(p.get("club_number") or 0)
-        for p in existing_team
-        if str(p.get("club_number", "")).isdigit()
-    })
+    dup_keys: set[tuple[str, str]] = set()
+    existing_numbers: set[int] = set()
+    for p in existing_team:
+        dup_keys.add(
+            (
+                _norm_name(p.get("name") or p.get("Name", "")),
+                str(p.get("date_of_birth") or "").split("T")[0],
+            )
+        )
+        # club_number on Supabasessa int-sarake (tai None)
+        number = p.get("club_number")
+        if isinstance(number, int) and number > 0:
+            existing_numbers.add(number)
 
     with st.container():
         st.caption("Data source: Supabase · players table")
@@ -118,10 +219,9 @@ def show_add_player_form():
 
         c4, c5, c6 = st.columns([1,1,1])
         with c4:
-            default_idx = POSITIONS_PRIMARY.index("CM") if "CM" in POSITIONS_PRIMARY else 0
-            primary_pos = st.selectbox("Pelipaikka (ensisijainen)", POSITIONS_PRIMARY, index=default_idx)
+            primary_pos = st.selectbox("Pelipaikka (ensisijainen)", POSITIONS_PRIMARY, index=_DEFAULT_PRIMARY_IDX)
         with c5:
-            secondary_pos = st.multiselect("Pelipaikat (toissijaiset)", [p for p in POSITIONS_PRIMARY if p != primary_pos])
+            secondary_pos = st.multiselect("Pelipaikat (toissijaiset)", _SECONDARY_CHOICES[primary_pos])
         with c6:
             preferred_foot_ui = st.selectbox("Vahvempi jalka", ["", "Oikea", "Vasen", "Molemmat"])
 
@@ -171,16 +271,7 @@ def show_add_player_form():
                 st.warning("Paino näyttää poikkeavalta. Tarkista yksikkö (kg).")
 
             # Duplikaatti: sama nimi + DOB samassa joukkueessa
-            dup = next(
-                (
-                    p
-                    for p in existing_team
-                    if _norm_name(p.get("name") or p.get("Name", "")) == nm
-                    and str(p.get("date_of_birth") or "").split("T")[0] == dob.isoformat()
-                ),
-                None,
-            )
-            if dup:
+            if (nm, dob.isoformat()) in dup_keys:
                 errors.append("Sama nimi ja syntymäpäivä löytyy jo tästä joukkueesta.")
 
             # Numeron varoitus (ei blokata)
@@ -197,28 +288,11 @@ def show_add_player_form():
                 st.error("Supabase client is not configured.")
                 return
 
-            team_row = _resolve_team(team)
-            team_id = team_row.get("id") if team_row else None
-            if team_id is None:
-                try:
-                    inserted = client.table("teams").insert({"name": team}).execute()
-                    team_data = inserted.data or []
-                    if team_data:
-                        team_id = team_data[0].get("id")
-                except APIError:
-                    # If insert fails (likely due to unique constraint), try loading again
-                    team_row = _resolve_team(team)
-                    team_id = team_row.get("id") if team_row else None
-
             # Rakenna tietue Supabaseen
-            rec_id = uuid.uuid4().hex
             secondary_positions = [p for p in secondary_pos if p]
             tag_list = [t.strip() for t in (tags or "").split(",") if t.strip()]
             record = {
-                "id": rec_id,
                 "name": nm,
-                "team_name": team,
-                "team_id": team_id,
                 "date_of_birth": dob.isoformat(),
                 "nationality": (nationality or "").strip() or None,
                 "height": int(height) if height else None,
@@ -230,23 +304,28 @@ def show_add_player_form():
                 "notes": (notes or "").strip() or None,
                 "tags": tag_list or None,
             }
+            # Sama id säilyy vain, jos sisältö on sama: toistettu submit osuu
+            # pääavaimeen, mutta muokattu lomake saa uuden id:n eikä häviä.
+            rec_id = _pending_player_id(team, record, photo)
+            record = {"id": rec_id, **record}
 
             # Tallenna kuva (jos annettu)
             if photo is not None:
-                photos_dir = DATA_DIR / "player_photos"
-                photos_dir.mkdir(parents=True, exist_ok=True)
                 ext = Path(photo.name).suffix.lower() or ".png"
                 safe_name = _slugify(f"{nm}-{rec_id[:6]}")
-                out_path = photos_dir / f"{safe_name}{ext}"
-                out_path.write_bytes(photo.read())
+                out_path = PLAYER_PHOTOS_DIR / f"{safe_name}{ext}"
+                photo.seek(0)
+                with out_path.open("wb") as fh:
+                    shutil.copyfileobj(photo, fh, length=1024 * 1024)
                 record["photo_path"] = str(out_path)
 
             try:
-                client.table("players").insert(record).execute()
+                _save_player(client, team, record)
             except APIError as err:
                 st.error(f"Failed to save player to Supabase: {getattr(err, 'message', str(err))}")
                 return
 
+            st.session_state.pop(_PENDING_ID_KEY, None)
             _push_to_master(team, record)
 
             st.success(f"Pelaaja '{nm}' lisätty joukkueeseen {team}.")
@@ -104,7 +104,7 @@ def show_age_minutes() -> None:
             return
 
         st.subheader(f"📊 Summary for team: {team_name}")
-        df = load_data(team_name)
+        # df was already loaded in the controls column (and refreshed after saves)
         df = add_minutes_per_match(df)
 
         metrics = calculate_summary(df)
@@ -114,9 +114,10 @@ def show_age_minutes() -> None:
         col3.metric("Total Matches", metrics["total_matches"])
         col4.metric("Minutes/Match", metrics["avg_minutes_per_match"])
 
-        df = df.copy()
-        df["ContractStart"] = pd.to_datetime(df["ContractStart"], errors="coerce")
-        df["ContractEnd"] = pd.to_datetime(df["ContractEnd"], errors="coerce")
+        # df is this run's own copy → no .copy(); parse only if not already datetime
+        for col in ("ContractStart", "ContractEnd"):
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], errors="coerce")
         fig = create_minutes_age_plot(df)
         st.plotly_chart(fig, use_container_width=True)
 
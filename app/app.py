@@ -2,6 +2,7 @@
 # file: app/app.py
 from __future__ import annotations
 from pathlib import Path
+import os
 import re
 import importlib
 import importlib.machinery
@@ -50,8 +51,10 @@ def _bootstrap_local_package() -> Path:
             sys.path.remove(path_str)
         sys.path.insert(0, path_str)
 
-    for candidate in (project_root, local_app_dir):
-        _prepend(candidate)
+    # Uusintaajoilla polut ovat jo kärjessä → ei O(n) remove/insert -kierrosta
+    if sys.path[:2] != [str(local_app_dir), str(project_root)]:
+        for candidate in (project_root, local_app_dir):
+            _prepend(candidate)
 
     cached_app = sys.modules.get("app")
     if cached_app is not None and not getattr(cached_app, "__path__", None):
@@ -78,6 +81,8 @@ def _ensure_local_package_stub() -> None:
     init_file = local_app_dir / "__init__.py"
 
     pkg = sys.modules.get("app")
+    if getattr(pkg, "_scoutlens_bootstrapped", False):
+        return
     if pkg is None or not getattr(pkg, "__path__", None):
         spec = importlib.util.spec_from_file_location(
             "app",
@@ -105,16 +110,19 @@ def _ensure_local_package_stub() -> None:
         spec.submodule_search_locations = [package_path]
         pkg.__spec__ = spec
 
+    pkg._scoutlens_bootstrapped = True
+
 
 PROJECT_ROOT = _bootstrap_local_package()
 _ensure_local_package_stub()
 
 try:
     from app.utils.paths import ensure_project_paths, assert_app_paths
+    from app.utils.imports import cached_import
 except Exception as exc:  # pragma: no cover - startup diagnostics
     traceback.print_exc()
     st.error(
-        "Failed to import app.utils.paths during startup.\n"
+        "Failed to import app.utils during startup.\n"
         f"PROJECT_ROOT={PROJECT_ROOT}\n"
         f"sys.path[0:3]={sys.path[:3]}\n{exc}"
     )
@@ -122,7 +130,14 @@ except Exception as exc:  # pragma: no cover - startup diagnostics
 
 
 def _install_sidebar_guard() -> None:
-    """Wrap ``st.sidebar`` so accidental writes outside ``build_sidebar`` get logged."""
+    """Wrap ``st.sidebar`` so accidental writes outside ``build_sidebar`` get logged.
+
+    Debug aid only: installed when ``SCOUTLENS_SIDEBAR_GUARD=1`` is set, otherwise
+    ``st.sidebar`` stays the native ``DeltaGenerator``.
+    """
+
+    if os.getenv("SCOUTLENS_SIDEBAR_GUARD", "0") != "1":
+        return
 
     original_sidebar = st.sidebar
 
@@ -130,25 +145,37 @@ def _install_sidebar_guard() -> None:
         return
 
     def _log_violation(action: str) -> None:
-        store = st.session_state.setdefault("_sidebar_guard", {"violations": []})
+        store = st.session_state.setdefault(
+            "_sidebar_guard", {"violations": set(), "order": []}
+        )
         message = f"{action} (outside build_sidebar)"
         if message not in store["violations"]:
-            store["violations"].append(message)
+            store["violations"].add(message)
+            store["order"].append(message)
             store.pop("notified", None)
             print(f"[ScoutLens] Sidebar guard: {message}")
 
     class _SidebarProxy:
         """Proxy that mirrors ``DeltaGenerator`` but records misuse."""
 
-        __slots__ = ("_target",)
+        __slots__ = ("_target", "_cache")
+        _sl_guard_installed = True
 
         def __init__(self, target):
             self._target = target
+            # metodinimi -> kääre; proxy elää koko prosessin ajan
+            self._cache = {}
 
         def _active(self) -> bool:
             return bool(st.session_state.get("_sidebar_owner_active"))
 
         def __getattr__(self, name):  # noqa: D401 - proxy helper
+            if self._active():
+                # build_sidebarin sisällä ei ole mitään valvottavaa → suoraan kohteeseen
+                return getattr(self._target, name)
+            cached = self._cache.get(name)
+            if cached is not None:
+                return cached
             attr = getattr(self._target, name)
             if callable(attr):
 
@@ -157,6 +184,7 @@ def _install_sidebar_guard() -> None:
                         _log_violation(f"st.sidebar.{name}")
                     return attr(*args, **kwargs)
 
+                self._cache[name] = wrapped
                 return wrapped
             return attr
 
@@ -174,7 +202,6 @@ def _install_sidebar_guard() -> None:
             return self._target.__exit__(exc_type, exc, tb)
 
     proxy = _SidebarProxy(original_sidebar)
-    setattr(proxy, "_sl_guard_installed", True)
     st.sidebar = proxy  # type: ignore[assignment]
 
 
@@ -184,94 +211,121 @@ PKG_DIR = ROOT / "app"
 
 _install_sidebar_guard()
 
-importlib.invalidate_caches()
-
 # ---- Import resolver guard (avoid 3rd‑party package named "app")
-_spec = importlib.util.find_spec("app")
-_spec_has_location = False
-if _spec is not None:
-    origin = getattr(_spec, "origin", None)
-    search_locations = getattr(_spec, "submodule_search_locations", None)
-    _spec_has_location = bool(origin or search_locations)
-if not _spec or not _spec_has_location:
-    st.error(
-        "Cannot resolve local package 'app'. Check repo layout and permissions.\n"
-        f"ROOT={ROOT}\nPKG_DIR={PKG_DIR}\nsys.path[0:3]={sys.path[:3]}"
-    )
-    st.stop()
+# Tarkistettu spec talletetaan pakettiin → uusintaajoilla ei uutta find_spec-kierrosta
+_spec = getattr(sys.modules.get("app"), "_scoutlens_spec", None)
+if _spec is None:
+    _spec = importlib.util.find_spec("app")
+    _spec_has_location = False
+    if _spec is not None:
+        origin = getattr(_spec, "origin", None)
+        search_locations = getattr(_spec, "submodule_search_locations", None)
+        _spec_has_location = bool(origin or search_locations)
+    if not _spec or not _spec_has_location:
+        st.error(
+            "Cannot resolve local package 'app'. Check repo layout and permissions.\n"
+            f"ROOT={ROOT}\nPKG_DIR={PKG_DIR}\nsys.path[0:3]={sys.path[:3]}"
+        )
+        st.stop()
+    if "app" in sys.modules:
+        sys.modules["app"]._scoutlens_spec = _spec
 
 # ---- Delay all local imports until after bootstrapping
-track = importlib.import_module("app.perf").__getattribute__("track")
-render_perf = importlib.import_module("app.perf").__getattribute__("render_perf")
-go = importlib.import_module("app.ui.nav").__getattribute__("go")
-# NOTE: Some environments may bundle outdated ``app.ui`` packages without the
-# ``bootstrap_sidebar_auto_collapse`` re-export. Import the sidebar module
-# directly so we always access the canonical implementation.
-bootstrap_sidebar_auto_collapse = importlib.import_module(
-    "app.ui.sidebar"
-).__getattribute__("bootstrap_sidebar_auto_collapse")
-bootstrap_global_ui = importlib.import_module("app.ui.bootstrap").__getattribute__(
-    "bootstrap_global_ui"
-)
-set_sidebar_background = importlib.import_module("app.ui.sidebar_bg").__getattribute__(
-    "set_sidebar_background"
-)
-build_sidebar = importlib.import_module("app.ui.sidebar").__getattribute__(
-    "build_sidebar"
-)
-render_sidebar_toggle = importlib.import_module("app.ui.sidebar_toggle").__getattribute__(
-    "render_sidebar_toggle"
-)
-apply_theme = importlib.import_module("app.theme.codex_theme").__getattribute__(
-    "apply_theme"
-)
-ensure_fontawesome = importlib.import_module("app.ui.icon_pack").__getattribute__(
-    "ensure_fontawesome"
-)
 try:
-    _sidebar_toggle_css = importlib.import_module("app.ui.sidebar_toggle_css")
-    improve_collapsed_toggle_visibility = getattr(
-        _sidebar_toggle_css,
-        "improve_collapsed_toggle_visibility",
-    )
-    inject_collapsed_toggle_white_style = getattr(
-        _sidebar_toggle_css,
-        "inject_collapsed_toggle_white_style",
-    )
-except Exception as e:
-    st.error(f"Import error: app.ui.sidebar_toggle_css ({e}). Check package files.")
-    raise
+    from app.perf import track, render_perf
+    from app.ui.nav import go
+    # NOTE: Some environments may bundle outdated ``app.ui`` packages without the
+    # ``bootstrap_sidebar_auto_collapse`` re-export. Import the sidebar module
+    # directly so we always access the canonical implementation.
+    from app.ui.sidebar import bootstrap_sidebar_auto_collapse, build_sidebar
+    from app.ui.bootstrap import bootstrap_global_ui
+    from app.ui.sidebar_bg import set_sidebar_background
+    from app.ui.sidebar_toggle import render_sidebar_toggle
+    from app.theme.codex_theme import apply_theme
+    from app.ui.icon_pack import ensure_fontawesome
+    from app.ui.sidebar_toggle_css import inject_collapsed_toggle_white_style
+except Exception as e:  # pragma: no cover - startup diagnostics
+    traceback.print_exc()
+    st.error(f"Import error: {getattr(e, 'name', None) or 'app.ui'} ({e}). Check package files.")
+    st.stop()
 
 st.set_page_config(page_title="Main", layout="wide", initial_sidebar_state="expanded")
 bootstrap_global_ui()
 apply_theme()
 ensure_fontawesome()
-improve_collapsed_toggle_visibility()
+# render_sidebar_toggle lähettää myös toggle-ikonin CSS:n (ent. improve_collapsed_toggle_visibility)
 render_sidebar_toggle()
 
-if not paths_ok.get("css_file_exists", True):
-    st.warning(f"CSS file not found at {paths_ok.get('css_file_path')}. Check paths.")
+if not paths_ok.css_file_exists:
+    st.warning(f"CSS file not found at {paths_ok.css_file_path}. Check paths.")
+
+
+# Lainausmerkkien sisällä voi olla ';' (esim. Google Fonts -URL)
+_IMPORT_RE = re.compile(r"""@import(?:"[^"]*"|'[^']*'|[^;"'])+;""")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WS_RE = re.compile(r"\s+")
+
+
+@st.cache_data(show_spinner=False)
+def _load_styles_bundle(
+    files: tuple[str, ...], sig: tuple[tuple[int, int], ...]
+) -> tuple[str, str]:
+    """Read and join CSS files; ``sig`` (mtime_ns, size) keys the cache so edits invalidate it.
+
+    Returns ``(imports, body)`` with ``@import`` rules hoisted out of the body,
+    comments stripped and whitespace collapsed (smaller payload per rerun).
+    """
+    css_imports = []
+    css_blocks = []
+
+    def _grab(m: re.Match) -> str:
+        css_imports.append(m.group(0))
+        return ""
+
+    for path in files:
+        try:
+            text = Path(path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
+        # kommentit pois ensin, ettei kommentoitua @importia nosteta
+        text = _CSS_COMMENT_RE.sub("", text)
+        # yksi regex-läpikäynti: @import-säännöt talteen ja pois tekstistä
+        text = _IMPORT_RE.sub(_grab, text)
+        css_blocks.append(_CSS_WS_RE.sub(" ", text).strip())
+    return "\n".join(css_imports), "\n".join(block for block in css_blocks if block)
+
+
+def _style_sig(files: tuple[str, ...]) -> tuple[tuple[int, int], ...]:
+    """``(mtime_ns, size)`` per file; missing files report ``(0, -1)``."""
+    sig = []
+    for f in files:
+        try:
+            info = os.stat(f)
+        except FileNotFoundError:
+            sig.append((0, -1))
+            continue
+        sig.append((info.st_mtime_ns, info.st_size))
+    return tuple(sig)
+
+
+def _load_styles(files: tuple[str, ...]) -> tuple[str, str]:
+    return _load_styles_bundle(files, _style_sig(files))
 
 
 def inject_css(path: str) -> None:
-    css_path = Path(path)
-    if css_path.exists():
-        st.markdown(
-            f"<style>{css_path.read_text(encoding='utf-8')}</style>",
-            unsafe_allow_html=True,
-        )
+    css = "\n".join(part for part in _load_styles((path,)) if part)
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 
-inject_css("app/styles/nav.css")
+inject_css(str(ROOT / "app" / "styles" / "nav.css"))
 
 # ---- Page imports (Streamlit-safe wrapper)
 
 def _safe_import(what: str, mod: str, attr: str):
     """Import attribute with on-screen diagnostics (Streamlit-safe)."""
     try:
-        m = importlib.import_module(mod)
-        v = getattr(m, attr)
-        return v
+        return cached_import(mod, attr)
     except Exception as e:  # why: surface exact failure to the UI for non-dev users
         st.error(f"ImportError while importing {what} from {mod}.{attr}: {e}")
         st.code(
@@ -284,22 +338,12 @@ def _safe_import(what: str, mod: str, attr: str):
         )
         st.stop()
 
-show_reports_page = _safe_import("reports page", "app.reports_page", "show_reports_page")
-show_calendar_page = _safe_import("calendar page", "app.calendar_page", "show_calendar_page")
-show_inspect_player = _safe_import("inspect player", "app.inspect_player", "show_inspect_player")
-show_shortlists_page = _safe_import("shortlists", "app.shortlists_page", "show_shortlists_page")
-show_player_management_page = _safe_import(
-    "player management", "app.player_management", "show_player_management_page"
-)
-show_shortlist_management_page = _safe_import(
-    "shortlist management", "app.shortlist_management", "show_shortlist_management_page"
-)
-show_export_page = _safe_import("export", "app.export_page", "show_export_page")
-login = _safe_import("login", "app.login", "login")
-logout = _safe_import("logout", "app.login", "logout")
-show_quick_notes_page = _safe_import(
-    "notes", "app.quick_notes_page", "show_quick_notes_page"
-)
+try:
+    from app.login import login, logout
+except Exception:
+    # diagnostiikka vain virhepolulla
+    login = _safe_import("login", "app.login", "login")
+    logout = _safe_import("logout", "app.login", "logout")
 
 APP_TITLE = "ScoutLens"
 APP_TAGLINE = "LATAM scouting toolkit"
@@ -307,48 +351,32 @@ APP_VERSION = "0.9.1"
 
 # --------- CSS
 
+_THEME_FILES = (
+    "tokens_dark.css",
+    "layout.css",
+    "components.css",
+    "sidebar.css",
+    "animations.css",
+)
+_STYLES_DIR = ROOT / "app" / "styles"
+_THEME_PATHS = tuple(str(_STYLES_DIR / name) for name in _THEME_FILES)
+
+
 def inject_theme_css():
-    styles_dir = ROOT / "app" / "styles"
-    token_file = "tokens_dark.css"
-    css_imports = []
-    css_blocks = []
-    for name in [
-        token_file,
-        "layout.css",
-        "components.css",
-        "sidebar.css",
-        "animations.css",
-    ]:
-        p = styles_dir / name
-        if p.exists():
-            text = p.read_text(encoding="utf-8")
-            imports = re.findall(r"@import[^;]+;", text)
-            if imports:
-                css_imports.extend(imports)
-                text = re.sub(r"@import[^;]+;", "", text)
-            css_blocks.append(text.strip())
-    # remove previously injected theme blocks if present
-    st.markdown(
-        "<script>['sl-theme','sl-theme-imports'].forEach(id=>{const el=document.getElementById(id); if(el) el.remove();});</script>",
-        unsafe_allow_html=True,
-    )
+    css_imports, css_body = _load_styles(_THEME_PATHS)
+    html = ""
     if css_imports:
-        st.markdown(
-            f"<style id='sl-theme-imports'>{'\n'.join(css_imports)}</style>",
-            unsafe_allow_html=True,
-        )
-    css_body = "\n".join(block for block in css_blocks if block)
+        html += f"<style id='sl-theme-imports'>{css_imports}</style>"
     if css_body:
-        st.markdown(
-            f"<style id='sl-theme'>{css_body}</style>",
-            unsafe_allow_html=True,
-        )
+        html += f"<style id='sl-theme'>{css_body}</style>"
+    if html:
+        st.markdown(html, unsafe_allow_html=True)
 
 def _render_sidebar_guard_report() -> None:
     guard = st.session_state.get("_sidebar_guard")
     if not guard:
         return
-    violations = guard.get("violations", [])
+    violations = guard.get("order", [])
     if not violations or guard.get("notified"):
         return
 
@@ -363,7 +391,7 @@ def _render_sidebar_guard_report() -> None:
 
 
 # --------- Nav
-NAV_KEYS = [
+NAV_KEYS = (
     "Reports",
     "Calendar",
     "Inspect Player",
@@ -372,8 +400,9 @@ NAV_KEYS = [
     "Players",
     "Notes",
     "Export",
-]
-NAV_LABELS = {
+)
+_NAV_KEY_SET = frozenset(NAV_KEYS)
+NAV_LABELS = types.MappingProxyType({
     "Reports": "Reports",
     "Calendar": "Calendar",
     "Inspect Player": "Inspect Player",
@@ -382,8 +411,8 @@ NAV_LABELS = {
     "Players": "Players",
     "Notes": "Quick notes",
     "Export": "Export",
-}
-NAV_ICONS = {
+})
+NAV_ICONS = types.MappingProxyType({
     "Reports": "",
     "Calendar": "",
     "Inspect Player": "",
@@ -392,24 +421,33 @@ NAV_ICONS = {
     "Players": "",
     "Notes": "",
     "Export": "",
-}
-LEGACY_REMAP = {
+})
+LEGACY_REMAP = types.MappingProxyType({
     "home": "Reports",
     "team_view": "Reports",
     "scout_reporter": "Reports",
     "shortlists": "Shortlists",
     "player_editor": "Shortlists",
-}
-PAGE_FUNCS = {
-    "Reports": show_reports_page,
-    "Calendar": show_calendar_page,
-    "Inspect Player": show_inspect_player,
-    "Shortlists": show_shortlists_page,
-    "Manage Shortlists": show_shortlist_management_page,
-    "Players": show_player_management_page,
-    "Notes": show_quick_notes_page,
-    "Export": show_export_page,
-}
+})
+_LEGACY_KEYS = frozenset(LEGACY_REMAP)
+# Sivut (moduuli, funktio) -pareina; moduuli importataan vasta kun sivu avataan
+PAGE_FUNCS = types.MappingProxyType({
+    "Reports": ("app.reports_page", "show_reports_page"),
+    "Calendar": ("app.calendar_page", "show_calendar_page"),
+    "Inspect Player": ("app.inspect_player", "show_inspect_player"),
+    "Shortlists": ("app.shortlists_page", "show_shortlists_page"),
+    "Manage Shortlists": ("app.shortlist_management", "show_shortlist_management_page"),
+    "Players": ("app.player_management", "show_player_management_page"),
+    "Notes": ("app.quick_notes_page", "show_quick_notes_page"),
+    "Export": ("app.export_page", "show_export_page"),
+})
+
+
+def _resolve_page(p: str | None) -> str:
+    """Map a ``?p=`` value (legacy or canonical) to a nav key."""
+    if p in _LEGACY_KEYS:
+        p = LEGACY_REMAP[p]
+    return p if p in _NAV_KEY_SET else NAV_KEYS[0]
 
 
 def main() -> None:
@@ -421,9 +459,7 @@ def main() -> None:
     login()
 
     if "current_page" not in st.session_state:
-        p = st.query_params.get("p", None)
-        p = LEGACY_REMAP.get(p, p)
-        st.session_state["current_page"] = p if p in NAV_KEYS else NAV_KEYS[0]
+        st.session_state["current_page"] = _resolve_page(st.query_params.get("p", None))
 
     current = st.session_state.get("current_page", NAV_KEYS[0])
 
@@ -442,9 +478,13 @@ def main() -> None:
     inject_theme_css()
     set_sidebar_background()
 
-    page_func = PAGE_FUNCS.get(current, lambda: st.error("Page not found."))
+    spec = PAGE_FUNCS.get(current)
+    # Sivumoduulin import lasketaan mukaan sivun aikaan (ensimmäinen avaus)
     with track(f"page:{current}"):
-        page_func()
+        if spec is None:
+            st.error("Page not found.")
+        else:
+            _safe_import(f"{current} page", *spec)()
     render_perf()
     _render_sidebar_guard_report()
     inject_collapsed_toggle_white_style()
@@ -15,14 +15,20 @@ else:
         (Path(os.getenv("APPDATA", Path.home())) / APP_NAME)
     )
 
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-
 
 def file_path(name: str) -> Path:
     return DATA_DIR / name
 
 
+# Yleisimmät JSON-tiedostot vakioina, ettei kutsujat rakenna polkuja itse
+PLAYERS_FP = file_path("players.json")
+REPORTS_FP = file_path("scout_reports.json")
+MATCHES_FP = file_path("matches.json")
+TEAMS_FP = file_path("teams.json")
+
+
 # Player photos and export artefacts can still live locally, but the
 # primary data source (players, teams, matches, reports, notes) is Supabase.
 PLAYER_PHOTOS_DIR = DATA_DIR / "player_photos"
+# parents=True luo myös DATA_DIRin → yksi mkdir importissa kahden sijaan
 PLAYER_PHOTOS_DIR.mkdir(parents=True, exist_ok=True)
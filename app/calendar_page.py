@@ -8,6 +8,7 @@ import os
 import tempfile
 import uuid
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from urllib.parse import quote_plus, urlencode
@@ -33,10 +34,20 @@ MATCHES_PATH = DATA_DIR / "matches.json"
 DEFAULT_MATCH_LENGTH_MINUTES = 120
 SELECTBOX_KEY = "calendar_selected_event_id"
 VISIBLE_DATE_KEY = "calendar_visible_date"
-GMAPS_API_KEY = st.secrets.get("GOOGLE_MAPS_API_KEY") or os.getenv("GOOGLE_MAPS_API_KEY")
 LOCAL_TZ_SESSION_KEY = "calendar_detected_tz"
 
 
+def _secret_or_env(name: str) -> str | None:
+    try:
+        value = st.secrets.get(name)
+    except Exception:  # why: no secrets.toml (tests, bare local runs)
+        value = None
+    return value or os.getenv(name)
+
+
+GMAPS_API_KEY = _secret_or_env("GOOGLE_MAPS_API_KEY")
+
+
 # ============== Infra helpers ==============
 def _safe_rerun() -> None:
     """Version-safe rerun."""
@@ -80,18 +91,25 @@ def _write_json_atomic(path: Path, data: Any) -> None:
 
 
 # ============== Time helpers ==============
+_UTC = ZoneInfo("UTC")
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str | None) -> ZoneInfo | None:
+    """ZoneInfo by name, parsed once per process; ``None`` for empty/unknown names."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:  # pragma: no cover
+        return None
+
+
 def _ensure_timezone(dt: datetime | None, tz_name: str | None) -> datetime | None:
     if dt is None:
         return None
-    tz = None
-    if tz_name:
-        try:
-            tz = ZoneInfo(tz_name)
-        except Exception:  # pragma: no cover
-            tz = None
-    if tz is None:
-        return dt
-    return dt.astimezone(tz)
+    tz = _tz(tz_name)
+    return dt.astimezone(tz) if tz is not None else dt
 
 
 def _parse_datetime(value: Any) -> datetime | None:
@@ -105,8 +123,8 @@ def _parse_datetime(value: Any) -> datetime | None:
         except ValueError:
             return None
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
-    return dt.astimezone(ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
 # ============== Local timezone helpers ==============
@@ -190,7 +208,7 @@ def _gmaps_timezone_lookup(lat: float | None, lng: float | None) -> str | None:
     url = "https://maps.googleapis.com/maps/api/timezone/json"
     params = {
         "location": f"{lat},{lng}",
-        "timestamp": int(datetime.now(ZoneInfo("UTC")).timestamp()),
+        "timestamp": int(datetime.now(_UTC).timestamp()),
         "key": GMAPS_API_KEY,
     }
     try:
@@ -230,74 +248,122 @@ def _build_google_maps_url(match: Dict[str, Any]) -> str | None:
 
 
 # ============== Domain transforms ==============
-def _match_to_event(match: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]] | None:
-    kickoff_utc = _parse_datetime(match.get("kickoff_at"))
-    if kickoff_utc is None:
-        return None
+def _build_events(
+    matches: List[Dict[str, Any]],
+) -> Tuple[
+    List[Dict[str, Any]],
+    Dict[str, Dict[str, Any]],
+    List[Tuple[str, Dict[str, Any]]],
+    List[str],
+]:
+    """One pass over ``matches`` → (events, metadata by event id, (event id, match) pairs, match ids)."""
+    events: List[Dict[str, Any]] = []
+    metadata_map: Dict[str, Dict[str, Any]] = {}
+    enriched: List[Tuple[str, Dict[str, Any]]] = []
+    match_ids: List[str] = []
 
-    tz_name = match.get("tz_name") or match.get("timezone") or "UTC"
-    kickoff_local = _ensure_timezone(kickoff_utc, tz_name) or kickoff_utc
-    location_tz_name = (match.get("location_tz_name") or "").strip() or None
-    creator_tz_name = (match.get("creator_tz_name") or "").strip() or None
+    # local bindings: no global lookups inside the loop
+    parse_dt = _parse_datetime
+    to_tz = _ensure_timezone
+    maps_url_for = _build_google_maps_url
+    normalize_targets = _normalize_target_players
+    default_length = timedelta(minutes=DEFAULT_MATCH_LENGTH_MINUTES)
+
+    for match in matches:
+        get = match.get
+        kickoff_utc = parse_dt(get("kickoff_at"))
+        if kickoff_utc is None:
+            continue
+
+        match_id = get("id")
+        event_id = match_id or f"match-{kickoff_utc.isoformat()}"
+        if not isinstance(event_id, str) or not event_id:
+            continue
+
+        tz_name = get("tz_name") or get("timezone") or "UTC"
+        kickoff_local = to_tz(kickoff_utc, tz_name) or kickoff_utc
+        location_tz_name = (get("location_tz_name") or "").strip() or None
+        creator_tz_name = (get("creator_tz_name") or "").strip() or None
 
-    ends_at = _parse_datetime(match.get("ends_at_utc"))
-    if ends_at is None:
-        ends_at = kickoff_utc + timedelta(minutes=DEFAULT_MATCH_LENGTH_MINUTES)
-    end_local = _ensure_timezone(ends_at, tz_name) or ends_at
+        ends_at = parse_dt(get("ends_at_utc"))
+        if ends_at is None:
+            ends_at = kickoff_utc + default_length
+        end_local = to_tz(ends_at, tz_name) or ends_at
 
-    title_parts = [match.get("home_team") or "", match.get("away_team") or ""]
-    title = " vs ".join(part for part in title_parts if part) or "Match"
+        home = get("home_team")
+        away = get("away_team")
+        if home and away:
+            title = f"{home} vs {away}"
+        else:
+            title = home or away or "Match"
 
-    event_id = match.get("id") or f"match-{kickoff_utc.isoformat()}"
-    match_id = match.get("id")
+        maps_url = maps_url_for(match)
+        location = get("location")
+        competition = get("competition")
 
-    maps_url = _build_google_maps_url(match)
+        events.append(
+            {
+                "id": event_id,
+                "title": title,
+                "start": kickoff_local.isoformat(timespec="seconds"),
+                "end": end_local.isoformat(timespec="seconds"),
+                "allDay": False,
+                "extendedProps": {
+                    "match_id": match_id,
+                    "home_team": home,
+                    "away_team": away,
+                    "location": location,
+                    "competition": competition,
+                    "tz_name": tz_name,
+                    "kickoff_utc": kickoff_utc.isoformat(),
+                    "kickoff_local": kickoff_local.isoformat(),
+                    "google_maps_url": maps_url,
+                    "location_tz_name": location_tz_name,
+                    "creator_tz_name": creator_tz_name,
+                },
+            }
+        )
 
-    event = {
-        "id": event_id,
-        "title": title,
-        "start": kickoff_local.replace(microsecond=0).isoformat(),
-        "end": end_local.replace(microsecond=0).isoformat(),
-        "allDay": False,
-        "extendedProps": {
+        local_targets = normalize_targets(get("targets"))
+        metadata_map[event_id] = {
+            "event_id": event_id,
             "match_id": match_id,
-            "home_team": match.get("home_team"),
-            "away_team": match.get("away_team"),
-            "location": match.get("location"),
-            "competition": match.get("competition"),
+            "home_team": home,
+            "away_team": away,
+            "location": location,
+            "venue": get("venue"),
+            "competition": competition,
+            "kickoff_local": kickoff_local,
+            "kickoff_utc": kickoff_utc,
             "tz_name": tz_name,
-            "kickoff_utc": kickoff_utc.isoformat(),
-            "kickoff_local": kickoff_local.isoformat(),
-            "google_maps_url": maps_url,
             "location_tz_name": location_tz_name,
             "creator_tz_name": creator_tz_name,
-        },
-    }
+            "notes": get("notes"),
+            "google_maps_url": maps_url,
+            "targets": local_targets,
+            "target_player_ids": [
+                entry.get("player_id")
+                for entry in local_targets
+                if isinstance(entry.get("player_id"), str) and entry.get("player_id")
+            ],
+        }
+        enriched.append((event_id, match))
+        if match_id:
+            match_ids.append(match_id)
+
+    return events, metadata_map, enriched, match_ids
 
-    local_targets = _normalize_target_players(match.get("targets"))
-    metadata = {
-        "event_id": event_id,
-        "match_id": match_id,
-        "home_team": match.get("home_team"),
-        "away_team": match.get("away_team"),
-        "location": match.get("location"),
-        "venue": match.get("venue"),
-        "competition": match.get("competition"),
-        "kickoff_local": kickoff_local,
-        "kickoff_utc": kickoff_utc,
-        "tz_name": tz_name,
-        "location_tz_name": location_tz_name,
-        "creator_tz_name": creator_tz_name,
-        "notes": match.get("notes"),
-        "google_maps_url": maps_url,
-        "targets": local_targets,
-        "target_player_ids": [
-            entry.get("player_id")
-            for entry in local_targets
-            if isinstance(entry.get("player_id"), str) and entry.get("player_id")
-        ],
-    }
-    return event, metadata
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_events() -> Tuple[
+    List[Dict[str, Any]],
+    Dict[str, Dict[str, Any]],
+    List[Tuple[str, Dict[str, Any]]],
+    List[str],
+]:
+    # Same ttl as _load_matches; widget reruns no longer rebuild the events.
+    # cache_data returns a copy → the page's own edits to the metadata don't leak into the cache.
+    return _build_events(_load_matches())
 
 
 # ============== Local matches I/O ==============
@@ -557,8 +623,8 @@ def _calendar_event_details(metadata: Dict[str, Any]) -> str:
 
 
 def _format_ics_datetime(dt: datetime) -> str:
-    aware = dt if dt.tzinfo else dt.replace(tzinfo=ZoneInfo("UTC"))
-    return aware.astimezone(ZoneInfo("UTC")).strftime("%Y%m%dT%H%M%SZ")
+    aware = dt if dt.tzinfo else dt.replace(tzinfo=_UTC)
+    return aware.astimezone(_UTC).strftime("%Y%m%dT%H%M%SZ")
 
 
 def _escape_ics(value: str) -> str:
@@ -599,7 +665,7 @@ def _build_ics_attachment(metadata: Dict[str, Any]) -> Tuple[str, bytes] | None:
     location = _calendar_event_location(metadata)
     details = _calendar_event_details(metadata)
     uid_source = metadata.get("match_id") or metadata.get("event_id") or uuid.uuid4().hex
-    now_utc = datetime.now(ZoneInfo("UTC"))
+    now_utc = datetime.now(_UTC)
     lines = [
         "BEGIN:VCALENDAR",
         "VERSION:2.0",
@@ -795,25 +861,7 @@ def show_calendar_page() -> None:
     _maybe_show_recent_success()
     _render_add_match_form()
 
-    matches = _load_matches()
-
-    events: List[Dict[str, Any]] = []
-    metadata_map: Dict[str, Dict[str, Any]] = {}
-    match_ids: List[str] = []
-    enriched_matches: List[Tuple[str, Dict[str, Any]]] = []
-    for match in matches:
-        converted = _match_to_event(match)
-        if not converted:
-            continue
-        event, metadata = converted
-        event_id = event.get("id")
-        if not isinstance(event_id, str) or not event_id:
-            continue
-        events.append(event)
-        metadata_map[event_id] = metadata
-        enriched_matches.append((event_id, match))
-        if metadata.get("match_id"):
-            match_ids.append(metadata["match_id"])
+    events, metadata_map, enriched_matches, match_ids = _load_events()
 
     targets_map = _load_match_targets(tuple(match_ids))
     player_lookup: Dict[str, Dict[str, Any]] = {}
@@ -921,15 +969,17 @@ def show_calendar_page() -> None:
         st.success(_format_match_label(metadata_map[selected_event_id]))
 
     st.subheader("Match details")
-    detail_ids = list(metadata_map.keys())
+    # id → index in one pass; the player filter can reorder metadata_map,
+    # so the map is built here rather than in _build_events
+    id_to_index = {event_id: idx for idx, event_id in enumerate(metadata_map)}
+    detail_ids = list(id_to_index)
     if not detail_ids:
         st.caption("No match metadata available. Add a match to see its details here.")
     else:
-        if default_selected_id not in detail_ids:
-            default_selected_id = detail_ids[0]
-            st.session_state[SELECTBOX_KEY] = default_selected_id
-
-        default_index = detail_ids.index(default_selected_id) if default_selected_id in detail_ids else 0
+        default_index = id_to_index.get(default_selected_id)
+        if default_index is None:
+            default_index = 0
+            st.session_state[SELECTBOX_KEY] = detail_ids[0]
 
         selected_id = st.selectbox(
             "Select a match to inspect",
@@ -971,15 +1021,16 @@ def _render_match_details(selected: Dict[str, Any]) -> None:
             st.metric("Local kickoff", "Unknown")
     with cols[1]:
         if isinstance(kickoff_utc, datetime):
-            st.metric("UTC kickoff", kickoff_utc.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%d %H:%M"))
+            st.metric("UTC kickoff", kickoff_utc.astimezone(_UTC).strftime("%Y-%m-%d %H:%M"))
         else:
             st.metric("UTC kickoff", "Unknown")
     if show_creator_metric and isinstance(kickoff_utc, datetime):
         with cols[2]:
-            try:
-                creator_dt = kickoff_utc.astimezone(ZoneInfo(creator_tz_name))
+            creator_tz = _tz(creator_tz_name)
+            if creator_tz is not None:
+                creator_dt = kickoff_utc.astimezone(creator_tz)
                 st.metric("Creator kickoff", creator_dt.strftime("%Y-%m-%d %H:%M"), help=creator_tz_name)
-            except Exception:
+            else:
                 st.metric("Creator kickoff", "Unavailable", help=creator_tz_name)
 
     st.markdown("### Fixture information")
@@ -1090,7 +1141,7 @@ def _render_upcoming_and_past(matches: List[Dict[str, Any]]) -> None:
 
 
 def _split_matches(matches: List[Dict[str, Any]]) -> Tuple[List[Tuple[datetime, Dict[str, Any]]], List[Tuple[datetime, Dict[str, Any]]]]:
-    now_utc = datetime.now(ZoneInfo("UTC"))
+    now_utc = datetime.now(_UTC)
     upcoming: List[Tuple[datetime, Dict[str, Any]]] = []
     past: List[Tuple[datetime, Dict[str, Any]]] = []
     for match in matches:
@@ -1374,6 +1425,7 @@ def _handle_match_submission(
     st.session_state["calendar_last_tz"] = tz_clean
     st.session_state["calendar_recent_add"] = f"Match {home_clean} vs {away_clean} added."
     _load_matches.clear()
+    _load_events.clear()
     _load_match_targets.clear()
     _safe_rerun()
 
@@ -1396,6 +1448,7 @@ def _handle_delete_match(match_id: str) -> None:
     st.session_state["calendar_recent_add"] = "Match removed from the calendar."
     st.session_state.pop(SELECTBOX_KEY, None)
     _load_matches.clear()
+    _load_events.clear()
     _load_match_targets.clear()
     _safe_rerun()
 
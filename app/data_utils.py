@@ -349,7 +349,7 @@ def validate_player_input(name: str, df: pd.DataFrame) -> Tuple[bool, str]:
     nm = (name or "").strip()
     if not nm:
         return False, "Name cannot be empty."
-    if "Name" in df.columns and nm in df["Name"].astype(str).tolist():
+    if "Name" in df.columns and df["Name"].astype(str).eq(nm).any():
         return False, "Player name already exists."
     return True, ""
 
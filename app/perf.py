@@ -1,7 +1,11 @@
+from collections import deque
 from contextlib import contextmanager
 import time
 import streamlit as st
 
+# Rolling history per label (P50/P95); bounded so session_state does not grow
+_HIST_LEN = 50
+
 
 def _is_debug() -> bool:
     try:
@@ -16,6 +20,21 @@ def track(label: str):
     yield
     dur = (time.perf_counter() - start) * 1000
     st.session_state.setdefault("_perf", []).append((label, dur))
+    hist = st.session_state.setdefault("_perf_hist", {})
+    if label not in hist:
+        hist[label] = deque(maxlen=_HIST_LEN)
+    hist[label].append(dur)
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _clear_caches() -> None:
+    st.cache_data.clear()
+    st.cache_resource.clear()
 
 
 def render_perf() -> None:
@@ -27,4 +46,20 @@ def render_perf() -> None:
         with st.expander("⏱ Perf", expanded=False):
             for name, dur in entries:
                 st.write(f"{name}: {dur:.1f} ms")
+            hist = st.session_state.get("_perf_hist", {})
+            pages = sorted(
+                ((name, vals) for name, vals in hist.items() if name.startswith("page:")),
+                key=lambda item: _percentile(item[1], 95),
+                reverse=True,
+            )
+            if pages:
+                # Slowest page first (by P95), over the last _HIST_LEN runs
+                st.caption(f"Pages, last {_HIST_LEN} runs")
+                for name, vals in pages:
+                    st.write(
+                        f"{name}: P50 {_percentile(vals, 50):.1f} ms · "
+                        f"P95 {_percentile(vals, 95):.1f} ms (n={len(vals)})"
+                    )
+            # Clear caches only on request (debug), never on every run
+            st.button("🧹 Clear cache", key="perf-clear-cache", on_click=_clear_caches)
     st.session_state["_perf"] = []
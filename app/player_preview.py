@@ -19,22 +19,39 @@ def _inject_css_once(key: str, css_html: str):
 
 import plotly.express as px
 
-from app.app_paths import file_path, DATA_DIR
-
-# ---- tiedostopolut
-PLAYERS_FP = file_path("players.json")
-REPORTS_FP = file_path("scout_reports.json")
-MATCHES_FP = file_path("matches.json")
-TEAMS_FP   = file_path("teams.json")  # fallbackia varten
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib fallback below
+    orjson = None
+
+# ---- tiedostopolut (TEAMS_FP fallbackia varten)
+from app.app_paths import (
+    MATCHES_FP,
+    PLAYER_PHOTOS_DIR,
+    PLAYERS_FP,
+    REPORTS_FP,
+    TEAMS_FP,
+)
 
 # ---- perus JSON-apurit
+# max_entries: 4 tiedostoa × tuore + edellinen versio; vanhat (mtime, koko) -avaimet poistuvat
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_json_cached(path_str: str, mtime_ns: int, size: int):
+    # mtime/size ovat vain välimuistiavaimia: muuttumaton tiedosto → ei uutta parsintaa
+    fp = Path(path_str)
+    if orjson is not None:
+        return orjson.loads(fp.read_bytes())
+    return json.loads(fp.read_text(encoding="utf-8"))
+
 def _load_json(fp: Path, default):
     try:
-        if fp.exists():
-            return json.loads(fp.read_text(encoding="utf-8"))
+        stat = fp.stat()
+    except OSError:
+        return default
+    try:
+        return _parse_json_cached(str(fp), stat.st_mtime_ns, stat.st_size)
     except Exception:
-        pass
-    return default
+        return default
 
 # ---- tiimit: käytä teams_storea, muuten fallback
 try:
@@ -154,7 +171,7 @@ def _find_photo_for(player_row: dict) -> Path | None:
         if p.exists():
             return p
 
-    photos_dir = DATA_DIR / "player_photos"
+    photos_dir = PLAYER_PHOTOS_DIR
     if photos_dir.exists():
         base = _slugify(player_row.get("Name") or player_row.get("name") or "")
         for ext in (".png", ".jpg", ".jpeg"):
@@ -175,22 +192,26 @@ def _find_photo_for(player_row: dict) -> Path | None:
     return None
 
 def _save_players(updated: list[dict]) -> None:
-    PLAYERS_FP.write_text(json.dumps(updated, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        PLAYERS_FP.write_bytes(
+            orjson.dumps(updated, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        PLAYERS_FP.write_text(json.dumps(updated, ensure_ascii=False, indent=2), encoding="utf-8")
+    _parse_json_cached.clear()
 
 def _update_player_photo(rec_id: str, photo_bytes: bytes, suggested_name: str) -> Path | None:
-    photos_dir = DATA_DIR / "player_photos"
-    photos_dir.mkdir(parents=True, exist_ok=True)
     ext = Path(suggested_name).suffix.lower() or ".png"
     safe = _slugify(suggested_name.rsplit(".", 1)[0])
-    out = photos_dir / f"{safe}-{rec_id[:6]}{ext}"
+    out = PLAYER_PHOTOS_DIR / f"{safe}-{rec_id[:6]}{ext}"
     out.write_bytes(photo_bytes)
 
     data = _load_json(PLAYERS_FP, [])
     for p in data:
         if str(p.get("id") or "") == str(rec_id):
             p["photo_path"] = str(out)
+            _save_players(data)
             break
-    _save_players(data)
     return out
 
 def _parse_iso(ts: str | None) -> datetime:
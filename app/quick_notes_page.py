@@ -721,6 +721,14 @@ def _sync_query_params() -> None:
     qp["page"] = str(max(pagination.page, 1))
     qp["size"] = str(pagination.page_size)
 
+    # No write (= no extra message to the browser) when the URL is already up to date
+    if st.query_params.to_dict() == qp:
+        return
+    # from_dict replaces everything in one update (newer Streamlit versions)
+    from_dict = getattr(st.query_params, "from_dict", None)
+    if from_dict is not None:
+        from_dict(qp)
+        return
     st.query_params.clear()
     st.query_params.update(qp)
 
@@ -107,10 +107,11 @@ def show_shortlists_page() -> None:
         st.info("No shortlists yet. Create one above.")
         return
 
+    name_by_id = {s["id"]: s["name"] for s in shortlists}
     sid = st.selectbox(
         "Select shortlist",
-        options=[s["id"] for s in shortlists],
-        format_func=lambda x: next(s["name"] for s in shortlists if s["id"] == x),
+        options=list(name_by_id),
+        format_func=name_by_id.get,
     )
     st.session_state["shortlists__sid"] = sid
     st.caption("Delete shortlists from the Manage Shortlists page.")
@@ -128,7 +129,7 @@ def show_shortlists_page() -> None:
         for p in players
     }
     add_pid = st.selectbox(
-        "Player", options=list(label_by_id.keys()), format_func=lambda x: label_by_id[x], key="shortlists__add_pid"
+        "Player", options=list(label_by_id.keys()), format_func=label_by_id.get, key="shortlists__add_pid"
     )
     if st.button("Add to shortlist", type="primary"):
         try:
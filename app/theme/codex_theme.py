@@ -1,7 +1,8 @@
 # File: app/theme/codex_theme.py
 from __future__ import annotations
 
-from typing import Dict, List, Literal, Mapping, Optional
+from functools import lru_cache
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
 import streamlit as st
 
 ThemeName = Literal["auto", "dark", "light"]
@@ -177,6 +178,14 @@ a:hover {{ color: var(--brand-primary-600); }}
 *:focus {{ outline: 2px solid var(--focus); outline-offset: 2px; }}
 """
 
+@lru_cache(maxsize=None)
+def _default_tokens_tag() -> str:
+    # Default palettes never change at runtime → build the CSS once per process
+    return _style_tag("codex-theme-tokens", _build_css_tokens(PALETTE_DARK, PALETTE_LIGHT))
+
+# Last (theme, colorway) registered with the chart libraries; None = overrides in use
+_dataviz_applied: Optional[Tuple[str, str]] = None
+
 def _force_theme_script(theme: ThemeName) -> str:
     if theme == "auto":
         return ""
@@ -215,13 +224,27 @@ def apply_theme(
     - colorway: categorical palette for charts
     - overrides_*: token overrides by theme
     """
+    global _dataviz_applied
+
     dark = _merge_palettes(PALETTE_DARK, overrides_dark)
     light = _merge_palettes(PALETTE_LIGHT, overrides_light)
+    defaults = not overrides_dark and not overrides_light
 
     if force and theme in ("dark", "light"):
         st.markdown(_script_tag("codex-force-theme", _force_theme_script(theme)), unsafe_allow_html=True)
 
-    st.markdown(_style_tag("codex-theme-tokens", _build_css_tokens(dark, light)), unsafe_allow_html=True)
+    tokens_tag = (
+        _default_tokens_tag()
+        if defaults
+        else _style_tag("codex-theme-tokens", _build_css_tokens(dark, light))
+    )
+    st.markdown(tokens_tag, unsafe_allow_html=True)
+
+    # Plotly/Altair/Matplotlib themes are process-wide: re-register only on change
+    key = (theme, colorway) if defaults else None
+    if key is not None and key == _dataviz_applied:
+        return
+    _dataviz_applied = key
 
     palette = _COLORWAYS[colorway]
 
@@ -5,11 +5,9 @@ import streamlit as st
 
 _FONT_AWESOME_HREF = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css"
 
-
-def ensure_fontawesome() -> None:
-    """Ensure Font Awesome stylesheet is available in the active document."""
-    script = (
-        """
+# Built once at import; ensure_fontawesome only emits it
+_FONT_AWESOME_SCRIPT = (
+    """
 <script id="sl-fontawesome-loader">
 (function() {
   const w = window;
@@ -37,10 +35,13 @@ def ensure_fontawesome() -> None:
   doc.head.appendChild(link);
 })();
 </script>
-        """.strip()
-    ).replace("__HREF__", _FONT_AWESOME_HREF)
+    """.strip()
+).replace("__HREF__", _FONT_AWESOME_HREF)
 
-    st.markdown(script, unsafe_allow_html=True)
+
+def ensure_fontawesome() -> None:
+    """Ensure Font Awesome stylesheet is available in the active document."""
+    st.markdown(_FONT_AWESOME_SCRIPT, unsafe_allow_html=True)
 
 
 __all__ = ["ensure_fontawesome"]
@@ -88,19 +88,14 @@ def build_sidebar(
         icon_map = {k: nav_icons.get(k, "") for k in nav_options}
 
         with st.sidebar:
-            st.markdown(_build_header_html(app_title, app_tagline, logo_data_uri), unsafe_allow_html=True)
+            # Header card and nav title as a single delta
+            header_html = _build_header_html(app_title, app_tagline, logo_data_uri)
+            if nav_options:
+                header_html += _NAV_TITLE_HTML
+            st.markdown(header_html, unsafe_allow_html=True)
 
             selected_option: Optional[str] = None
             if nav_options:
-                st.markdown(
-                    """
-                    <div class='sb-nav-title' role='heading' aria-level='2'>
-                      <span class='sb-nav-text'>Navigation</span>
-                      <span class='sb-nav-underline' aria-hidden='true'></span>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
                 try:
                     selected_option = _build_nav(
                         current,
@@ -131,8 +126,10 @@ def build_sidebar(
                     use_container_width=True,
                 )
 
-            st.markdown(_build_footer_html(app_title, app_version), unsafe_allow_html=True)
-            st.markdown(_sidebar_alert_script(), unsafe_allow_html=True)
+            st.markdown(
+                _build_footer_html(app_title, app_version) + _sidebar_alert_script(),
+                unsafe_allow_html=True,
+            )
 
 
 __all__ = ["bootstrap_sidebar_auto_collapse", "build_sidebar"]
@@ -174,6 +171,15 @@ def _force_dark_theme() -> None:
     )
 
 
+_NAV_TITLE_HTML = """
+<div class='sb-nav-title' role='heading' aria-level='2'>
+  <span class='sb-nav-text'>Navigation</span>
+  <span class='sb-nav-underline' aria-hidden='true'></span>
+</div>
+"""
+
+
+@lru_cache(maxsize=8)
 def _build_header_html(title: str, tagline: str, logo_data_uri: str) -> str:
     logo_html = (
         f"<div class='sb-logo'><img src='{logo_data_uri}' alt='{escape(title)} logo' loading='lazy' decoding='async'/></div>"
@@ -209,9 +215,16 @@ def _build_nav(
         heading=None,
         container=nullcontext(),
         rerun_on_click=False,
+        on_select=_on_nav_select,
     )
 
 
+def _on_nav_select(page: str) -> None:
+    # Runs as an on_click callback before the next script run → the page
+    # switches in the same rerun, no extra st.rerun() round trip via go()
+    st.session_state["current_page"] = page
+
+
 def _build_profile_html(user: Dict[str, object]) -> str:
     name = (
         str(user.get("name") or "")
@@ -242,6 +255,7 @@ def _build_profile_html(user: Dict[str, object]) -> str:
     )
 
 
+@lru_cache(maxsize=8)
 def _build_footer_html(title: str, version: str) -> str:
     return (
         f"""
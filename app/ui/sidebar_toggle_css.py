@@ -177,17 +177,4 @@ def improve_collapsed_toggle_visibility() -> None:
 def inject_collapsed_toggle_white_style() -> None:
     """Force the collapsed toggle button to stay white with dark iconography."""
 
-    st.markdown(
-        f"""
-        <script>
-          (function() {{
-            const doc = window.parent?.document || document;
-            if (!doc) return;
-            const existing = doc.getElementById('{_COLLAPSED_WHITE_STYLE_ID}');
-            if (existing) existing.remove();
-          }})();
-        </script>
-        """,
-        unsafe_allow_html=True,
-    )
     st.markdown(_COLLAPSED_WHITE_STYLE, unsafe_allow_html=True)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 from contextlib import nullcontext
+from functools import lru_cache
 from html import escape
-from typing import Mapping, Sequence
+from typing import Callable, Mapping, Sequence
 
 import streamlit as st
 
@@ -98,6 +99,21 @@ _NAV_ICON_SCRIPT = r"""
 """
 
 
+_KEY_SUFFIX_RE = re.compile(r"[^0-9a-zA-Z_-]+")
+
+
+@lru_cache(maxsize=256)
+def _button_key(state_key: str, name: str) -> str:
+    key_suffix = _KEY_SUFFIX_RE.sub("_", name).strip("_") or "item"
+    return f"navbtn_{state_key}_{key_suffix}"
+
+
+def _select(state_key: str, name: str, on_select: Callable[[str], None] | None) -> None:
+    st.session_state[state_key] = name
+    if on_select is not None:
+        on_select(name)
+
+
 def render_sidebar_nav(
     options: Sequence[str],
     state_key: str = "nav_page",
@@ -107,8 +123,13 @@ def render_sidebar_nav(
     heading: str | None = "Navigation",
     container=None,
     rerun_on_click: bool = True,
+    on_select: Callable[[str], None] | None = None,
 ) -> str:
-    """Render button-based sidebar navigation with optional label/icon maps."""
+    """Render button-based sidebar navigation with optional label/icon maps.
+
+    ``on_select`` runs as the button's ``on_click`` callback, i.e. before the
+    rerun, so the new page renders on the click's own rerun.
+    """
     if not options:
         raise ValueError("render_sidebar_nav requires at least one option")
 
@@ -139,8 +160,7 @@ def render_sidebar_nav(
             else:
                 button_label = label
 
-            key_suffix = re.sub(r"[^0-9a-zA-Z_-]+", "_", name).strip("_") or "item"
-            key = f"navbtn_{state_key}_{key_suffix}"
+            key = _button_key(state_key, name)
             is_active = name == selected
 
             clicked = st.button(
@@ -148,8 +168,10 @@ def render_sidebar_nav(
                 key=key,
                 use_container_width=True,
                 disabled=is_active,
+                on_click=_select if on_select is not None else None,
+                args=(state_key, name, on_select) if on_select is not None else None,
             )
-            if clicked and not is_active:
+            if clicked and not is_active and on_select is None:
                 st.session_state[state_key] = name
                 if rerun_on_click:
                     st.rerun()
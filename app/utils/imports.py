@@ -0,0 +1,27 @@
+from __future__ import annotations
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+# (module, attr) -> (module object, value). Lives in this module because
+# Streamlit re-executes app.py on every rerun.
+_CACHE: dict[tuple[str, str], tuple[ModuleType, Any]] = {}
+
+
+def cached_import(module_path: str, attr: str) -> Any:
+    """Return ``module_path.attr``, resolving it only once per loaded module.
+
+    The cached value is reused while ``sys.modules`` still holds the same
+    module object, so Streamlit's reload-on-save keeps picking up new code.
+    """
+    key = (module_path, attr)
+    module = sys.modules.get(module_path)
+    hit = _CACHE.get(key)
+    if hit is not None and hit[0] is module:
+        return hit[1]
+    if module is None:
+        module = importlib.import_module(module_path)
+    value = getattr(module, attr)
+    _CACHE[key] = (module, value)
+    return value
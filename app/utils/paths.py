@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import NamedTuple
 import sys
 
 def ensure_project_paths() -> Path:
@@ -20,7 +21,15 @@ def ensure_project_paths() -> Path:
         _prepend(cand)
     return project_root
 
-def assert_app_paths() -> dict:
+class AppPaths(NamedTuple):
+    project_root: str
+    app_dir_exists: bool
+    ui_dir_exists: bool
+    css_file_exists: bool
+    css_file_path: str
+
+
+def assert_app_paths() -> AppPaths:
     """
     Varmista että app/ui/sidebar_toggle_css.py löytyy. Palauttaa statuksen.
     """
@@ -28,10 +37,10 @@ def assert_app_paths() -> dict:
     app_dir = project_root / "app"
     ui_dir = app_dir / "ui"
     css_file = ui_dir / "sidebar_toggle_css.py"
-    return {
-        "project_root": str(project_root),
-        "app_dir_exists": app_dir.exists(),
-        "ui_dir_exists": ui_dir.exists(),
-        "css_file_exists": css_file.exists(),
-        "css_file_path": str(css_file),
-    }
+    return AppPaths(
+        project_root=str(project_root),
+        app_dir_exists=app_dir.exists(),
+        ui_dir_exists=ui_dir.exists(),
+        css_file_exists=css_file.exists(),
+        css_file_path=str(css_file),
+    )
@@ -6,13 +6,10 @@ import json
 from pathlib import Path
 from postgrest.exceptions import APIError
 
-from app.app_paths import file_path
+from app.app_paths import PLAYERS_FP
 from app.data_utils import list_teams, load_master
 from app.supabase_client import get_client
 
-# ---------- JSON-polut ----------
-PLAYERS_FP = file_path("players.json")
-
 # ---------- apurit ----------
 def _load_json(fp: Path, default):
     try:
@@ -119,10 +116,11 @@ def show_visual_analytics():
         if not shortlists:
             st.info("No shortlists available.")
             return None
+        name_by_id = {s["id"]: s["name"] for s in shortlists}
         sid = st.selectbox(
             "Shortlist",
-            options=[s["id"] for s in shortlists],
-            format_func=lambda x: next(s["name"] for s in shortlists if s["id"] == x),
+            options=list(name_by_id),
+            format_func=name_by_id.get,
         )
         if not sid:
             return None
@@ -0,0 +1,34 @@
+-- 013_add_player_with_team.sql
+-- Resolve (or create) the team and insert the player in a single call so the
+-- add-player form needs one round trip instead of up to three.
+
+create or replace function public.add_player_with_team(p_team text, p_record jsonb)
+returns uuid
+language plpgsql
+as $$
+declare
+  v_team_id uuid;
+  v_player_id uuid;
+begin
+  insert into public.teams(name) values (p_team)
+  on conflict (name) do nothing;
+
+  select id into v_team_id from public.teams where name = p_team;
+
+  insert into public.players (
+    id, team_id, team_name, name, nationality, date_of_birth, preferred_foot,
+    club_number, primary_position, secondary_positions, height, weight,
+    notes, tags, photo_path
+  )
+  select
+    coalesce(r.id, gen_random_uuid()), v_team_id, p_team, r.name, r.nationality,
+    r.date_of_birth, r.preferred_foot, r.club_number, r.primary_position,
+    r.secondary_positions, r.height, r.weight, r.notes, r.tags, r.photo_path
+  from jsonb_populate_record(null::public.players, p_record) as r
+  -- A repeated submit reuses the form's id: keep the first row, no duplicate.
+  on conflict (id) do nothing
+  returning id into v_player_id;
+
+  return coalesce(v_player_id, (p_record->>'id')::uuid);
+end;
+$$;
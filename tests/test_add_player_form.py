@@ -0,0 +1,62 @@
+"""Tests for name normalisation in the add-player form."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.add_player_form import _norm_name
+
+
+def _norm_name_reference(s: str) -> str:
+    # Original per-token implementation; the fast path must match it exactly.
+    s = (s or "").strip()
+    parts = [p.capitalize() if len(p) > 1 else p.upper() for p in s.split()]
+    return " ".join(parts)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "",
+        "   ",
+        "lionel messi",
+        "  LIONEL   MESSI ",
+        "j. álvarez",
+        "a b",
+        "vinícius júnior",
+        "jean-philippe mateta",
+        "JEAN-PHILIPPE",
+        "o'neil",
+        "D'ANGELO o'brien",
+        "Mʼbappé",
+        "Ngũgĩ wa Thiongʼo",
+        "kylian mʼbappé",
+        "ángel di maría",
+        "ßeta",
+        "ǆokić",
+        "player 10",
+    ],
+)
+def test_norm_name_matches_reference(raw: str) -> None:
+    assert _norm_name(raw) == _norm_name_reference(raw)
+
+
+def test_norm_name_keeps_caseless_letters_inside_word() -> None:
+    assert _norm_name("Mʼbappé") == "Mʼbappé"
+    assert _norm_name("ngũgĩ wa thiongʼo") == "Ngũgĩ Wa Thiongʼo"
+
+
+def test_pending_player_id_reused_only_for_same_payload(monkeypatch) -> None:
+    from app import add_player_form
+
+    monkeypatch.setattr(add_player_form.st, "session_state", {})
+    record = {"name": "Lionel Messi", "date_of_birth": "1987-06-24"}
+
+    first = add_player_form._pending_player_id("Inter Miami", record, None)
+    # Same submit again (e.g. retry after a lost response) → same id
+    assert add_player_form._pending_player_id("Inter Miami", dict(record), None) == first
+
+    edited = {**record, "date_of_birth": "1987-06-25"}
+    second = add_player_form._pending_player_id("Inter Miami", edited, None)
+    assert second != first
+    assert add_player_form._pending_player_id("Barcelona", edited, None) != second
@@ -0,0 +1,93 @@
+"""Tests for the calendar page's event building."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.calendar_page import _build_events
+
+
+def _rows():
+    return [
+        {
+            "id": "m1",
+            "kickoff_at": "2025-05-01T18:00:00.500Z",
+            "ends_at_utc": "2025-05-01T20:30:00Z",
+            "tz_name": "America/Sao_Paulo",
+            "home_team": "Santos",
+            "away_team": "Flamengo",
+            "location": "Maracanã",
+            "competition": "Brasileirão",
+            "targets": [
+                {"player_id": "p1", "name": "A"},
+                {"id": "p2", "name": "B"},
+                {"name": "No id"},
+            ],
+        },
+        # no id, only one team, naive kickoff, unknown tz, no ends_at_utc
+        {
+            "kickoff_at": "2025-05-02T12:00:00",
+            "tz_name": "Not/AZone",
+            "away_team": "Boca",
+        },
+        # unparseable kickoff → skipped
+        {"id": "bad", "kickoff_at": "not a date"},
+        # non-string id → skipped
+        {"id": 7, "kickoff_at": "2025-05-04T12:00:00Z"},
+        # aware non-UTC kickoff, tz via the legacy "timezone" key, no teams
+        {
+            "id": "m5",
+            "kickoff_at": "2025-05-03T10:00:00+02:00",
+            "timezone": "Europe/Helsinki",
+        },
+    ]
+
+
+def test_build_events_ids_titles_and_times() -> None:
+    rows = _rows()
+    events, metadata, enriched, match_ids = _build_events(rows)
+
+    assert [e["id"] for e in events] == ["m1", "match-2025-05-02T12:00:00+00:00", "m5"]
+    assert [e["title"] for e in events] == ["Santos vs Flamengo", "Boca", "Match"]
+    assert [(e["start"], e["end"]) for e in events] == [
+        ("2025-05-01T15:00:00-03:00", "2025-05-01T17:30:00-03:00"),
+        ("2025-05-02T12:00:00+00:00", "2025-05-02T14:00:00+00:00"),
+        ("2025-05-03T11:00:00+03:00", "2025-05-03T13:00:00+03:00"),
+    ]
+    assert all(e["allDay"] is False for e in events)
+
+    assert match_ids == ["m1", "m5"]
+    assert [event_id for event_id, _ in enriched] == [e["id"] for e in events]
+    assert enriched[0][1] is rows[0]
+    assert list(metadata) == [e["id"] for e in events]
+
+
+def test_build_events_extended_props_and_metadata() -> None:
+    events, metadata, _, _ = _build_events(_rows())
+
+    props = events[0]["extendedProps"]
+    assert props["match_id"] == "m1"
+    assert props["tz_name"] == "America/Sao_Paulo"
+    assert props["kickoff_utc"] == "2025-05-01T18:00:00.500000+00:00"
+    assert props["kickoff_local"] == "2025-05-01T15:00:00.500000-03:00"
+    assert props["google_maps_url"] == "https://www.google.com/maps/search/?api=1&query=Maracan%C3%A3"
+    assert props["location_tz_name"] is None
+    assert props["creator_tz_name"] is None
+
+    meta = metadata["m1"]
+    assert meta["kickoff_utc"] == datetime(2025, 5, 1, 18, 0, 0, 500000, tzinfo=timezone.utc)
+    assert meta["kickoff_local"].utcoffset() == timedelta(hours=-3)
+    assert meta["competition"] == "Brasileirão"
+    assert meta["target_player_ids"] == ["p1", "p2"]
+    assert len(meta["targets"]) == 3
+
+    fallback = metadata["match-2025-05-02T12:00:00+00:00"]
+    assert fallback["match_id"] is None
+    assert fallback["tz_name"] == "Not/AZone"
+    assert fallback["kickoff_local"] == fallback["kickoff_utc"]
+    assert fallback["home_team"] is None
+    assert fallback["away_team"] == "Boca"
+    assert fallback["targets"] == []
+
+    assert metadata["m5"]["tz_name"] == "Europe/Helsinki"
+    assert metadata["m5"]["kickoff_utc"] == datetime(2025, 5, 3, 8, 0, tzinfo=timezone.utc)
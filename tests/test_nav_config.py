@@ -16,12 +16,21 @@ def _load_nav_config() -> dict[str, object]:
     desired = {"NAV_KEYS", "NAV_LABELS", "NAV_ICONS", "LEGACY_REMAP", "PAGE_FUNCS"}
     values: dict[str, object] = {}
 
+    def _unwrap(value: ast.AST) -> ast.AST:
+        # ``types.MappingProxyType({...})`` wraps the literal read-only
+        if isinstance(value, ast.Call) and len(value.args) == 1:
+            func = value.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            if name == "MappingProxyType":
+                return value.args[0]
+        return value
+
     for node in tree.body:
         if not isinstance(node, ast.Assign):
             continue
         for target in node.targets:
             if isinstance(target, ast.Name) and target.id in desired:
-                values[target.id] = node.value
+                values[target.id] = _unwrap(node.value)
 
     def _const_list(list_node: ast.AST) -> list[str]:
         if not isinstance(list_node, (ast.List, ast.Tuple)):